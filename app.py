@@ -4,7 +4,8 @@ Tkinter Weather App — OpenWeatherMap
 Requirements:
 - Python 3.9+
 - requests
-- Pillow (PIL)
+- orjson
+- Pillow (PIL); Pillow-SIMD can be swapped in on x86_64 (see README)
 
 Features:
 - Enter a city and fetch current weather (temp °C, condition) with icon
@@ -20,22 +21,223 @@ Setup:
 Author: Prince NZAMUWE
 """
 
+import functools
 import io
 import os
+import tempfile
 import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from multiprocessing.pool import ThreadPool
+from tkinter import font as tkfont, ttk, messagebox
 from PIL import Image, ImageTk
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ttkthemes import ThemedTk
 
 API_URL = "https://api.openweathermap.org/data/2.5/weather"
 ICON_URL = "https://openweathermap.org/img/wn/{icon}@2x.png"
-GEOCODE_URL = "http://api.openweathermap.org/geo/1.0/direct"
+ICON_SIZE = (120, 120)
+# Every icon code OpenWeatherMap serves (day/night variants)
+ICON_CODES = tuple(
+    f"{n}{t}"
+    for n in ("01", "02", "03", "04", "09", "10", "11", "13", "50")
+    for t in "dn"
+)
+ICON_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "prinko-weather", "icons"
+)
+FORECAST_URL = "https://api.openweathermap.org/data/2.5/forecast"
+GEOCODE_URL = "https://api.openweathermap.org/geo/1.0/direct"
+GEOCODE_LIMIT = 5  # Suggestions requested per lookup
+
+# One shared session so every call reuses pooled keep-alive connections;
+# transient 5xx / connection errors are retried with exponential backoff
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET",),
+        ),
+    ),
+)
+SESSION.headers["User-Agent"] = "PrinkoWeather/1.0"
+
+# Background colors keyed by OpenWeatherMap's canonical weather "main" value
+THEME_COLORS = {
+    "Clear": "#fff7b2",  # sunny yellow (soft)
+    "Clouds": "#e6e6e6",  # gray
+    "Rain": "#cfe8ff",  # blue-ish
+    "Drizzle": "#cfe8ff",
+    "Thunderstorm": "#cfe8ff",
+}
+DEFAULT_BG = "#f5f7fb"  # neutral
+
+# Cache lifetimes (seconds) per endpoint
+WEATHER_TTL = 60
+FORECAST_TTL = 10 * 60
+GEOCODE_TTL = 24 * 60 * 60
+
+# (url, params) -> (expiry, payload); the API key is left out of the key
+_CACHE = {}
+
+
+def _cache_key(url: str, params: dict) -> tuple:
+    return (
+        url,
+        tuple(sorted((k, str(v).lower()) for k, v in params.items() if k != "appid")),
+    )
+
+
+def cache_lookup(url: str, params: dict):
+    """Return the cached payload for a request, or None if missing or expired."""
+    key = _cache_key(url, params)
+    hit = _CACHE.get(key)
+    if hit is None:
+        return None
+    if hit[0] <= time.monotonic():
+        _CACHE.pop(key, None)
+        return None
+    return hit[1]
+
+
+def cached_get(url: str, params: dict, ttl: float, timeout: float = 10, parse=None):
+    """GET a JSON endpoint, reusing a cached payload until it is ttl seconds old.
+
+    If given, ``parse`` reduces the decoded JSON to the fields the caller
+    needs; only its result is cached.
+    """
+    hit = cache_lookup(url, params)
+    if hit is not None:
+        return hit
+
+    resp = SESSION.get(url, params=params, timeout=timeout)
+    data = orjson.loads(resp.content)  # Faster than resp.json(), skips str decode
+    if not resp.ok:
+        msg = data.get("message") if isinstance(data, dict) else None
+        raise ValueError(f"API error: {msg or 'Unable to fetch weather data.'}")
+    if parse is not None:
+        data = parse(data)
+    _CACHE[_cache_key(url, params)] = (time.monotonic() + ttl, data)
+    return data
+
+
+def parse_forecast(data: dict) -> dict:
+    """Reduce a forecast response to {YYYY-MM-DD: max temp} for the next 5 days."""
+    if str(data.get("cod")) != "200":
+        raise ValueError("Forecast not available.")
+    # Group the 3-hourly entries by UTC day number (same days as dt_txt)
+    # so no date strings are sliced per entry
+    daily = {}
+    get = daily.get
+    for item in data.get("list", []):
+        day = item["dt"] // 86400
+        temp = item["main"]["temp"]
+        daily[day] = temp if (cur := get(day)) is None else max(cur, temp)
+    return {
+        time.strftime("%Y-%m-%d", time.gmtime(day * 86400)): temp
+        for day, temp in list(daily.items())[:5]
+    }
+
+
+def suggestion_rows(places: list) -> list:
+    """Turn geocode results into (label, lat, lon) rows for the suggestion box."""
+    rows = []
+    for it in places:
+        name = it.get("name", "")
+        state = it.get("state", "")
+        country = it.get("country", "")
+        if state:
+            label = f"{name}, {state}, {country}"
+        else:
+            label = f"{name}, {country}"
+        rows.append((label, it.get("lat"), it.get("lon")))
+    return rows
+
+
+def cached_places(query: str):
+    """Answer a geocode lookup from the longest cached prefix of the query.
+
+    Uses the unexpired geocode entries in the response cache. Returns None
+    when nothing is cached or fewer than GEOCODE_LIMIT cached places still
+    match, so the caller asks the API instead.
+    """
+    for n in range(len(query), 1, -1):
+        places = cache_lookup(GEOCODE_URL, {"q": query[:n], "limit": GEOCODE_LIMIT})
+        if places is None:
+            continue
+        if n == len(query):
+            return places
+        matches = [p for p in places if p.get("name", "").lower().startswith(query)]
+        return matches if len(matches) >= GEOCODE_LIMIT else None
+    return None
+
+
+def load_icon(icon: str) -> Image.Image:
+    """Return the decoded icon image, reading it from the disk cache when present.
+
+    Pixel data is loaded here so decoding happens on the calling (worker)
+    thread rather than lazily on the Tk thread. A cached file that fails to
+    decode is deleted and downloaded again.
+    """
+    path = os.path.join(ICON_CACHE_DIR, f"{icon}.png")
+    if os.path.exists(path):
+        try:
+            with Image.open(path) as img:
+                img.load()
+                return img
+        except OSError:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    resp = SESSION.get(ICON_URL.format(icon=icon), timeout=10)
+    resp.raise_for_status()
+    with io.BytesIO(resp.content) as buf:
+        img = Image.open(buf)
+        img.load()
+    try:
+        # Write to a temp file and rename, so readers never see a partial icon
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=ICON_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(resp.content)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass  # Caching is best effort; still show the icon
+    return img
+
+
+def c_to_f(value):
+    """Convert Celsius to Fahrenheit, passing missing values through."""
+    return value * 9 / 5 + 32 if isinstance(value, (int, float)) else value
+
 
+def ms_to_mph(value):
+    """Convert metres per second to miles per hour."""
+    return value * 2.236936 if isinstance(value, (int, float)) else value
 
+
+@functools.lru_cache(maxsize=1)
 def load_api_key() -> str:
-    """Load API key from env var or .env file in current directory."""
+    """Load API key from env var or .env file in current directory.
+
+    The result is cached for the process lifetime, since it is read on every
+    autocomplete keystroke.
+    """
     key = os.getenv("OWM_API_KEY")
     if key:
         return key
@@ -63,8 +265,31 @@ class WeatherApp(ThemedTk):
         self.minsize(500, 400)
         self.resizable(True, True)
 
+        # Shared, bounded pool for all network work; its workers are daemon
+        # threads, so in-flight requests never delay exit
+        self._pool = ThreadPool(4)
+
+        # Named fonts, resolved once by Tk and shared by widgets by name
+        # (references kept so Tk doesn't delete them on garbage collection)
+        self._fonts = [
+            tkfont.Font(self, name=name, family="Segoe UI", size=size, weight=weight)
+            for name, size, weight in (
+                ("title_font", 20, "bold"),
+                ("temp_font", 28, "bold"),
+                ("cond_font", 16, "normal"),
+                ("body_font", 12, "normal"),
+                ("small_font", 10, "normal"),
+            )
+        ]
+
         # Keep a reference to the last PhotoImage to avoid garbage collection
         self._icon_photo = None
+        # Icon code -> PhotoImage, so each icon is decoded only once per run
+        self._icon_cache: dict[str, ImageTk.PhotoImage] = {}
+        # Icon code -> PIL image already resized to ICON_SIZE
+        self._resized_cache: dict[str, Image.Image] = {}
+        # Bumped per weather fetch so late icons from older fetches are ignored
+        self._weather_seq = 0
 
         # Configure a centered, responsive grid
         self.columnconfigure(0, weight=1)
@@ -79,9 +304,7 @@ class WeatherApp(ThemedTk):
         self.main.columnconfigure(1, weight=1)
 
         # Title label
-        self.title_lbl = ttk.Label(
-            self.main, text="Prinko Weather", font=("Segoe UI", 20, "bold")
-        )
+        self.title_lbl = ttk.Label(self.main, text="Prinko Weather", font="title_font")
         self.title_lbl.grid(row=0, column=0, columnspan=2, sticky="n", pady=(0, 15))
 
         # City entry + button in a sub-frame for better centering
@@ -89,7 +312,7 @@ class WeatherApp(ThemedTk):
         entry_frame.grid(row=1, column=0, columnspan=2, pady=(0, 10))
         self.city_var = tk.StringVar()
         self.city_entry = ttk.Entry(
-            entry_frame, textvariable=self.city_var, width=30, font=("Segoe UI", 12)
+            entry_frame, textvariable=self.city_var, width=30, font="body_font"
         )
         self.city_entry.grid(row=0, column=0, padx=(0, 10))
         self.city_entry.bind("<Return>", lambda e: self.fetch_weather())
@@ -106,7 +329,7 @@ class WeatherApp(ThemedTk):
         self.unit_btn.grid(row=0, column=2, padx=(10, 0))
 
         # Autocomplete listbox (hidden initially)
-        self.suggestions_box = tk.Listbox(self.main, height=5, font=("Segoe UI", 10))
+        self.suggestions_box = tk.Listbox(self.main, height=5, font="small_font")
         self.suggestions_box.bind("<<ListboxSelect>>", self._on_suggestion_select)
         self.suggestions_box.bind("<Double-Button-1>", self._on_suggestion_click)
         self.suggestions_box.bind(
@@ -115,11 +338,15 @@ class WeatherApp(ThemedTk):
         self.suggestions_box.bind("<Up>", self._navigate_suggestions)
         self.suggestions_box.bind("<Down>", self._navigate_suggestions)
         self.suggestions_visible = False
+        # (lat, lon) for each suggestion row, and the last picked place
+        self._suggestion_coords = []
+        self._selected_place = None
 
         # Progress bar for loading
         self.progress = ttk.Progressbar(self.main, mode="indeterminate")
         self.progress.grid(row=2, column=0, columnspan=2, pady=(5, 10), sticky="ew")
         self.progress.grid_remove()  # Hide initially
+        self._progress_after = None
 
         # Output area: temperature, condition, icon
         self.temp_var = tk.StringVar(value="— °C")
@@ -129,19 +356,19 @@ class WeatherApp(ThemedTk):
         )
 
         self.temp_lbl = ttk.Label(
-            self.main, textvariable=self.temp_var, font=("Segoe UI", 28, "bold")
+            self.main, textvariable=self.temp_var, font="temp_font"
         )
         self.temp_lbl.grid(row=3, column=0, columnspan=2, pady=(10, 5))
 
         self.cond_lbl = ttk.Label(
-            self.main, textvariable=self.cond_var, font=("Segoe UI", 16)
+            self.main, textvariable=self.cond_var, font="cond_font"
         )
         self.cond_lbl.grid(row=4, column=0, columnspan=2)
 
         self.details_lbl = ttk.Label(
             self.main,
             textvariable=self.details_var,
-            font=("Segoe UI", 12),
+            font="body_font",
             foreground="#555",
         )
         self.details_lbl.grid(row=5, column=0, columnspan=2, pady=(5, 10))
@@ -163,10 +390,26 @@ class WeatherApp(ThemedTk):
             self.main,
             textvariable=self.status_var,
             foreground="#444",
-            font=("Segoe UI", 10),
+            font="small_font",
         )
         self.status_lbl.grid(row=8, column=0, columnspan=2, pady=(10, 0))
 
+        # Background styles are created once and only recolored afterwards
+        self._style = ttk.Style(self)
+        self._current_bg = None
+        try:
+            self.main.configure(style="Bg.TFrame")
+        except tk.TclError:
+            pass
+        for lbl in (
+            self.title_lbl,
+            self.temp_lbl,
+            self.cond_lbl,
+            self.details_lbl,
+            self.status_lbl,
+        ):
+            lbl.configure(style="Bg.TLabel")
+
         # Default theme
         self.update_theme("Default")
 
@@ -174,10 +417,39 @@ class WeatherApp(ThemedTk):
         self.city_entry.bind("<KeyRelease>", self._on_keyrelease)
         self.city_entry.bind("<FocusOut>", lambda e: self._hide_suggestions())
         self._after_id = None
+        # Bumped per lookup so stale suggestions are dropped
+        self._autocomplete_seq = 0
+        self._autocomplete_cancel = threading.Event()
 
         # Focus the entry initially
         self.city_entry.focus_set()
 
+        # Warm the resized icon cache in the background
+        threading.Thread(target=self._prewarm_icons, daemon=True).start()
+
+    def _prewarm_icons(self):
+        """Load and resize every known icon so first displays skip the work."""
+        for icon in ICON_CODES:
+            try:
+                self._resized_icon(icon)
+            except Exception:
+                pass  # Fetched on demand later instead
+
+    def _resized_icon(self, icon: str) -> Image.Image:
+        """Return the icon at ICON_SIZE; call from a worker thread."""
+        resized = self._resized_cache.get(icon)
+        if resized is None:
+            resized = load_icon(icon).resize(ICON_SIZE, Image.LANCZOS)
+            self._resized_cache[icon] = resized
+        return resized
+
+    def destroy(self):
+        """Drop queued background work and close pooled HTTP connections
+        along with the window."""
+        self._pool.terminate()
+        SESSION.close()
+        super().destroy()
+
     def toggle_units(self):
         """Toggle between Celsius and Fahrenheit."""
         self.unit_var.set("F" if self.unit_var.get() == "C" else "C")
@@ -192,33 +464,36 @@ class WeatherApp(ThemedTk):
         - Rain/Drizzle/Thunderstorm → blue
         Else keep a neutral light background
         """
-        cond = (condition_main or "").lower()
-        if "clear" in cond:
-            bg = "#fff7b2"  # sunny yellow (soft)
-        elif "cloud" in cond:
-            bg = "#e6e6e6"  # gray
-        elif any(k in cond for k in ["rain", "drizzle", "thunder"]):
-            bg = "#cfe8ff"  # blue-ish
-        else:
-            bg = "#f5f7fb"  # neutral
+        bg = THEME_COLORS.get(condition_main, DEFAULT_BG)
+        if bg == self._current_bg:
+            return  # Nothing to restyle
+        self._current_bg = bg
 
-        # Apply background to root and non-ttk widgets; for ttk, set style map
+        # Apply background to root and non-ttk widgets; for ttk, recolor styles
         self.configure(bg=bg)
-        for w in (self.main,):
-            try:
-                w.configure(style="Bg.TFrame")
-            except tk.TclError:
-                pass
-        # Create/override a style with the computed background
-        style = ttk.Style(self)
-        style.configure("Bg.TFrame", background=bg)
-        style.configure("Bg.TLabel", background=bg)
-        # Apply to select labels that should blend
-        self.title_lbl.configure(style="Bg.TLabel")
-        self.temp_lbl.configure(style="Bg.TLabel")
-        self.cond_lbl.configure(style="Bg.TLabel")
-        self.details_lbl.configure(style="Bg.TLabel")
-        self.status_lbl.configure(style="Bg.TLabel")
+        self._style.configure("Bg.TFrame", background=bg)
+        self._style.configure("Bg.TLabel", background=bg)
+
+    def _start_progress(self):
+        """Show the progress bar only if the fetch is still running after 150 ms,
+        so cached responses never cause a layout pass."""
+        if self._progress_after is not None:
+            self.after_cancel(self._progress_after)
+        self._progress_after = self.after(150, self._show_progress)
+
+    def _show_progress(self):
+        self._progress_after = None
+        self.progress.grid()
+        self.progress.start()
+
+    def _stop_progress(self):
+        if self._progress_after is not None:
+            # Finished before the bar was shown: nothing to undo
+            self.after_cancel(self._progress_after)
+            self._progress_after = None
+            return
+        self.progress.stop()
+        self.progress.grid_remove()
 
     def _on_keyrelease(self, event=None):
         """Debounce key events and schedule autocomplete lookup."""
@@ -227,38 +502,46 @@ class WeatherApp(ThemedTk):
         self._after_id = self.after(400, self._do_autocomplete)
 
     def _do_autocomplete(self):
+        # Supersede any lookup still in flight
+        self._autocomplete_cancel.set()
+        self._autocomplete_cancel = cancelled = threading.Event()
+        self._autocomplete_seq += 1
+        seq = self._autocomplete_seq
+
         q = self.city_var.get().strip()
         if not q or len(q) < 2:
             self._hide_suggestions()
             return
 
+        places = cached_places(q.lower())
+        if places is not None:
+            self._show_suggestions(suggestion_rows(places), seq)
+            return
+
         def worker():
+            if cancelled.is_set():
+                return  # Superseded while queued; skip the request
             try:
-                params = {"q": q, "limit": 5, "appid": load_api_key()}
-                resp = requests.get(GEOCODE_URL, params=params, timeout=5)
-                resp.raise_for_status()
-                items = resp.json()
-                suggestions = []
-                for it in items:
-                    name = it.get("name", "")
-                    state = it.get("state", "")
-                    country = it.get("country", "")
-                    if state:
-                        label = f"{name}, {state}, {country}"
-                    else:
-                        label = f"{name}, {country}"
-                    suggestions.append(label)
+                params = {"q": q, "limit": GEOCODE_LIMIT, "appid": load_api_key()}
+                places = cached_get(GEOCODE_URL, params, GEOCODE_TTL, timeout=3)
+                suggestions = suggestion_rows(places)
             except Exception:
                 suggestions = []
 
-            self.after(0, lambda: self._show_suggestions(suggestions))
+            if cancelled.is_set():
+                return
+            self.after(0, lambda: self._show_suggestions(suggestions, seq))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._pool.apply_async(worker)
 
-    def _show_suggestions(self, items):
+    def _show_suggestions(self, items, seq=None):
+        if seq is not None and seq != self._autocomplete_seq:
+            return  # A newer lookup has started since
         self.suggestions_box.delete(0, tk.END)
-        for it in items:
-            self.suggestions_box.insert(tk.END, it)
+        self._suggestion_coords = []
+        for label, lat, lon in items:
+            self.suggestions_box.insert(tk.END, label)
+            self._suggestion_coords.append((lat, lon))
 
         if not items:
             self._hide_suggestions()
@@ -283,9 +566,11 @@ class WeatherApp(ThemedTk):
         sel = self.suggestions_box.curselection()
         if sel:
             value = self.suggestions_box.get(sel[0])
+            lat, lon = self._suggestion_coords[sel[0]]
+            self._selected_place = (value, lat, lon)
             self.city_var.set(value)
             self._hide_suggestions()
-            self.fetch_weather()
+            self.fetch_weather(lat=lat, lon=lon)
 
     def _on_suggestion_click(self, event=None):
         self._on_suggestion_select()
@@ -304,6 +589,16 @@ class WeatherApp(ThemedTk):
         self.suggestions_box.activate(new_index)
         self.suggestions_box.see(new_index)
 
+    def _location_params(self, city: str, lat=None, lon=None) -> dict:
+        """Query by coordinates when the city came from a suggestion, so the
+        API does not have to geocode the name again."""
+        place = self._selected_place
+        if lat is None and place and place[0] == city:
+            _, lat, lon = place
+        if lat is not None and lon is not None:
+            return {"lat": lat, "lon": lon}
+        return {"q": city}
+
     def fetch_forecast(self):
         """Fetch 5-day forecast for the current city."""
         city = self.city_var.get().strip()
@@ -315,32 +610,18 @@ class WeatherApp(ThemedTk):
             messagebox.showerror("Missing API Key", "API key required.")
             return
 
+        location = self._location_params(city)
         self.status_var.set("Fetching forecast…")
         self.forecast_btn.configure(state=tk.DISABLED)
 
         def worker():
             try:
-                params = {"q": city, "appid": api_key, "units": "metric"}
-                resp = requests.get(
-                    "https://api.openweathermap.org/data/2.5/forecast",
-                    params=params,
-                    timeout=10,
+                params = {**location, "appid": api_key, "units": "metric"}
+                forecast = cached_get(
+                    FORECAST_URL, params, FORECAST_TTL, parse=parse_forecast
                 )
-                resp.raise_for_status()
-                data = resp.json()
-                if resp.status_code != 200 or str(data.get("cod")) != "200":
-                    raise ValueError("Forecast not available.")
-
-                # Parse forecast (next 5 days, every 3 hours, take daily max)
-                forecast = {}
-                for item in data.get("list", []):
-                    dt = item["dt_txt"][:10]  # YYYY-MM-DD
-                    temp = item["main"]["temp"]
-                    if dt not in forecast or temp > forecast[dt]:
-                        forecast[dt] = temp
-
                 forecast_text = "\n".join(
-                    [f"{k}: {v:.1f}°C" for k, v in list(forecast.items())[:5]]
+                    [f"{k}: {v:.1f}°C" for k, v in forecast.items()]
                 )
                 self.after(
                     0, lambda: messagebox.showinfo("5-Day Forecast", forecast_text)
@@ -352,9 +633,9 @@ class WeatherApp(ThemedTk):
             finally:
                 self.after(0, lambda: self.forecast_btn.configure(state=tk.NORMAL))
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._pool.apply_async(worker)
 
-    def fetch_weather(self):
+    def fetch_weather(self, lat=None, lon=None):
         """Start a background thread to call the API so UI stays responsive."""
         self._hide_suggestions()  # Hide autocomplete suggestions
         city = self.city_var.get().strip()
@@ -371,17 +652,33 @@ class WeatherApp(ThemedTk):
 
         self.status_var.set("Fetching weather…")
         self.fetch_btn.configure(state=tk.DISABLED)
-        self.progress.grid()  # Show progress bar
-        self.progress.start()
+        self._start_progress()
 
         unit = "metric" if self.unit_var.get() == "C" else "imperial"
+        location = self._location_params(city, lat, lon)
+        # Every UI callback below checks seq, so a slower, older fetch can
+        # never overwrite what a newer one already displayed; the newest
+        # fetch's own callback stops the progress bar and re-enables the button
+        self._weather_seq += 1
+        seq = self._weather_seq
+
+        def set_icon(icon, resized):
+            if seq != self._weather_seq:
+                return  # A newer fetch owns the icon label now
+            if resized is None:  # Icon could not be loaded
+                self.icon_lbl.configure(image="")
+                return
+            photo = ImageTk.PhotoImage(resized)
+            self._icon_cache[icon] = self._icon_photo = photo
+            self.icon_lbl.configure(image=photo)
 
         def worker():
             try:
-                params = {"q": city, "appid": api_key, "units": unit}
-                resp = requests.get(API_URL, params=params, timeout=10)
-                data = resp.json()
-                if resp.status_code != 200 or str(data.get("cod")) != "200":
+                # Always request metric; Fahrenheit is converted locally so
+                # toggling units is served straight from the cache
+                params = {**location, "appid": api_key, "units": "metric"}
+                data = cached_get(API_URL, params, WEATHER_TTL)
+                if str(data.get("cod")) != "200":
                     msg = data.get("message", "Unable to fetch weather data.")
                     raise ValueError(f"API error: {msg}")
 
@@ -397,20 +694,24 @@ class WeatherApp(ThemedTk):
                 cond_main = condition.get("main", "")
                 cond_desc = condition.get("description", "").title()
                 icon = condition.get("icon", "")
+                if unit == "imperial":
+                    temp_c = c_to_f(temp_c)
+                    feels_like = c_to_f(feels_like)
+                    wind_speed = ms_to_mph(wind_speed)
+
+                # Load and resize the icon in parallel with the text update
+                if icon and icon not in self._icon_cache:
+                    self._pool.apply_async(
+                        self._resized_icon,
+                        (icon,),
+                        callback=lambda img: self.after(0, set_icon, icon, img),
+                        error_callback=lambda exc: self.after(0, set_icon, icon, None),
+                    )
 
-                # Download icon
-                icon_img = None
-                if icon:
-                    try:
-                        icon_url = ICON_URL.format(icon=icon)
-                        ic_resp = requests.get(icon_url, timeout=10)
-                        ic_resp.raise_for_status()
-                        icon_img = Image.open(io.BytesIO(ic_resp.content))
-                    except Exception:
-                        pass
-
-                # Update UI
+                # Update UI (the icon follows via set_icon unless cached)
                 def update_ui():
+                    if seq != self._weather_seq:
+                        return
                     temp_symbol = "°C" if unit == "metric" else "°F"
                     wind_symbol = "km/h" if unit == "metric" else "mph"
                     self.temp_var.set(
@@ -424,16 +725,15 @@ class WeatherApp(ThemedTk):
                         if humidity and wind_speed and feels_like
                         else f"Humidity: —% | Wind: — {wind_symbol} | Feels like: — {temp_symbol}"
                     )
-                    self.update_theme(cond_main or cond_desc)
-                    if icon_img:
-                        resized = icon_img.resize((120, 120), Image.LANCZOS)
-                        self._icon_photo = ImageTk.PhotoImage(resized)
+                    self.update_theme(cond_main)
+                    photo = self._icon_cache.get(icon)
+                    if photo is not None:
+                        self._icon_photo = photo
                         self.icon_lbl.configure(image=self._icon_photo)
-                    else:
+                    elif not icon:
                         self.icon_lbl.configure(image="")
                     self.status_var.set(f"Updated for {city}")
-                    self.progress.stop()
-                    self.progress.grid_remove()
+                    self._stop_progress()
                     self.fetch_btn.configure(state=tk.NORMAL)
 
                 self.after(0, update_ui)
@@ -442,10 +742,11 @@ class WeatherApp(ThemedTk):
                 error_msg = str(ve)
 
                 def show_err():
+                    if seq != self._weather_seq:
+                        return
                     self.status_var.set(error_msg)
                     messagebox.showerror("City Error", error_msg)
-                    self.progress.stop()
-                    self.progress.grid_remove()
+                    self._stop_progress()
                     self.fetch_btn.configure(state=tk.NORMAL)
 
                 self.after(0, show_err)
@@ -454,10 +755,11 @@ class WeatherApp(ThemedTk):
                 error_msg = str(re)
 
                 def show_net():
+                    if seq != self._weather_seq:
+                        return
                     self.status_var.set("Network error — check internet and try again.")
                     messagebox.showerror("Network Error", error_msg)
-                    self.progress.stop()
-                    self.progress.grid_remove()
+                    self._stop_progress()
                     self.fetch_btn.configure(state=tk.NORMAL)
 
                 self.after(0, show_net)
@@ -466,15 +768,16 @@ class WeatherApp(ThemedTk):
                 error_msg = str(e)
 
                 def show_generic():
+                    if seq != self._weather_seq:
+                        return
                     self.status_var.set("Unexpected error occurred.")
                     messagebox.showerror("Error", error_msg)
-                    self.progress.stop()
-                    self.progress.grid_remove()
+                    self._stop_progress()
                     self.fetch_btn.configure(state=tk.NORMAL)
 
                 self.after(0, show_generic)
 
-        threading.Thread(target=worker, daemon=True).start()
+        self._pool.apply_async(worker)
 
 
 def main():